@@ -118,7 +118,9 @@ class ConfigureDialog(QtWidgets.QDialog):
         config = {
             'identifier': self._ui.idLineEdit.text(),
             'fileFormat': self._ui.fileFormatCombo.currentText(),
-            'fileLoc': self._ui.fileLocLineEdit.text()
+            'fileLoc': self._ui.fileLocLineEdit.text(),
+            'arrayNames': self._ui.arrayNamesLineEdit.text(),
+            'spatialIndex': self._ui.spatialIndexCheckBox.isChecked()
         }
         return config
 
@@ -137,6 +139,8 @@ class ConfigureDialog(QtWidgets.QDialog):
             )
         )
         self._ui.fileLocLineEdit.setText(config['fileLoc'])
+        self._ui.arrayNamesLineEdit.setText(config['arrayNames'])
+        self._ui.spatialIndexCheckBox.setChecked(config['spatialIndex'])
 
     def _fileLocClicked(self):
         location = QtWidgets.QFileDialog.getOpenFileName(self, 'Select File Location', self._previousFileLoc)
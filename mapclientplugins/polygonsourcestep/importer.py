@@ -18,14 +18,19 @@ This file is part of MAP Client. (http://launchpad.net/mapclient)
     along with MAP Client.  If not, see <http://www.gnu.org/licenses/>..
 """
 
+import platform
+import struct
+import sys
 from os import path
-from numpy import array
+
+import numpy as np
 
 from vtkmodules.vtkIOImport import vtkVRMLImporter
 from vtkmodules.vtkIOGeometry import vtkOBJReader, vtkSTLReader
 from vtkmodules.vtkIOPLY import vtkPLYReader
 from vtkmodules.vtkIOXML import vtkXMLPolyDataReader
 from vtkmodules.vtkIOLegacy import vtkPolyDataReader
+from vtkmodules.util.numpy_support import vtk_to_numpy
 
 
 class Reader(object):
@@ -165,32 +170,72 @@ class Reader(object):
         P = self.polydata.GetPoints().GetData()
         self._dimensions = P.GetNumberOfComponents()
         self._nPoints = P.GetNumberOfTuples()
-
-        if self._dimensions == 1:
-            self._points = array([P.GetTuple1(i) for i in range(self._nPoints)])
-        elif self._dimensions == 2:
-            self._points = array([P.GetTuple2(i) for i in range(self._nPoints)])
-        elif self._dimensions == 3:
-            self._points = array([P.GetTuple3(i) for i in range(self._nPoints)])
-        elif self._dimensions == 4:
-            self._points = array([P.GetTuple4(i) for i in range(self._nPoints)])
-        elif self._dimensions == 9:
-            self._points = array([P.GetTuple9(i) for i in range(self._nPoints)])
+        self._points = vtk_to_numpy(P).astype(float)
 
     def _load_triangles(self):
         polyData = self.polydata.GetPolys().GetData()
-        X = [int(polyData.GetTuple1(i)) for i in range(polyData.GetNumberOfTuples())]
 
         # assumes that faces are triangular
-        X = array(X).reshape((-1, 4))
+        X = vtk_to_numpy(polyData).astype(int).reshape((-1, 4))
         self._nFaces = X.shape[0]
         self._triangles = X[:, 1:]
 
+    def get_point_data(self, names=None):
+        """Return the point-data arrays of the polydata as a dict of
+        numpy arrays keyed by array name. If names is given, only those
+        arrays are converted.
+        """
+        return self._load_arrays(self.polydata.GetPointData(), names)
+
+    def get_cell_data(self, names=None):
+        """Return the cell-data arrays of the polydata as a dict of
+        numpy arrays keyed by array name. If names is given, only those
+        arrays are converted. Only the rows of polygon cells are returned,
+        so row i of each array belongs to triangle i.
+        """
+        # vtk orders cells as verts, lines, polys then strips
+        start = self.polydata.GetNumberOfVerts() + self.polydata.GetNumberOfLines()
+        stop = start + self.polydata.GetNumberOfPolys()
+        arrays = self._load_arrays(self.polydata.GetCellData(), names)
+        return {name: a[start:stop] for name, a in arrays.items()}
+
+    def get_data(self, names=None):
+        """Return a dict with 'point' and 'cell' entries holding the
+        point-data and cell-data arrays of the polydata. If names is
+        given, only arrays with those names are converted and every name
+        must be present in either the point or the cell data.
+        """
+        data = {
+            'point': self.get_point_data(names),
+            'cell': self.get_cell_data(names),
+        }
+        if names is not None:
+            missing = set(names).difference(data['point'], data['cell'])
+            if missing:
+                raise ValueError('data arrays not found: {}'.format(', '.join(sorted(missing))))
+
+        return data
+
+    @staticmethod
+    def _load_arrays(fieldData, names=None):
+        # vtk_to_numpy wraps the vtk buffer, so arrays are not copied
+        arrays = {}
+        for i in range(fieldData.GetNumberOfArrays()):
+            a = fieldData.GetArray(i)
+            # GetArray returns None for non-numeric arrays, e.g. string arrays
+            if a is None or a.GetName() is None:
+                continue
+            if names is not None and a.GetName() not in names:
+                continue
+            arrays[a.GetName()] = vtk_to_numpy(a)
+
+        return arrays
+
 
 supported_suffixes = ('auto', 'stl', 'wrl', 'obj', 'ply', 'vtp')
 
 
-def import_polygon(suffix, filename):
+def _read_polygon(suffix, filename):
     if suffix not in supported_suffixes:
         raise ValueError('Unsupported suffix {}'.format(suffix))
 
@@ -208,4 +253,95 @@ def import_polygon(suffix, filename):
     elif suffix == 'vtp':
         r.read_vtp(filename)
 
+    return r
+
+
+def import_polygon(suffix, filename):
+    r = _read_polygon(suffix, filename)
     return r.get_points(), r.get_triangles()
+
+
+def import_polygon_data(suffix, filename, array_names=None):
+    """Import vertices, faces and the point and cell data arrays of a
+    polygon file. array_names selects the data arrays to extract, all
+    arrays are extracted if it is None.
+    """
+    r = _read_polygon(suffix, filename)
+    return r.get_points(), r.get_triangles(), r.get_data(array_names)
+
+
+def _file_key(filename):
+    import scipy
+    # the cache holds scipy's native node buffer, so it is only valid on the
+    # same platform and with the same scipy and numpy builds
+    return (path.abspath(filename), repr(path.getmtime(filename)), str(path.getsize(filename)),
+            scipy.__version__, np.__version__, sys.platform, platform.machine(),
+            str(struct.calcsize('P')))
+
+
+def _load_spatial_index(cache_filename, key, points):
+    from scipy.spatial import cKDTree
+
+    with np.load(cache_filename, allow_pickle=False) as f:
+        if f['key'].tolist() != list(key):
+            return None
+        state = []
+        for i in range(int(f['nstate'])):
+            name = 'state_{}'.format(i)
+            if name not in f.files:
+                state.append(None)
+            elif f[name].ndim == 0:
+                state.append(f[name].item())
+            else:
+                state.append(f[name])
+
+    # the node buffer in state is not validated before it is handed to scipy
+    tree = cKDTree.__new__(cKDTree)
+    tree.__setstate__(tuple(state))
+
+    # catches a cache written for other points; not a guarantee of integrity
+    if tree.n != len(points) or not np.array_equal(tree.data, points):
+        return None
+    indices = np.asarray(tree.indices)
+    if indices.shape != (tree.n,) or not np.array_equal(np.sort(indices), np.arange(tree.n)):
+        return None
+
+    return tree
+
+
+def _save_spatial_index(cache_filename, key, tree):
+    state = tree.__getstate__()
+    arrays = {'state_{}'.format(i): v for i, v in enumerate(state) if v is not None}
+    with open(cache_filename, 'wb') as f:
+        np.savez(f, key=np.array(key), nstate=len(state), **arrays)
+
+
+def spatial_index(points, filename, cache_filename=None):
+    """Return a cKDTree of points read from filename. If cache_filename is
+    given, the tree is saved to it and reused on later calls as long as
+    filename, the platform and the scipy and numpy versions have not
+    changed. A cache that is out of date, cannot be parsed or cannot be
+    written is ignored. The cache stores scipy's internal tree state, which
+    is restored without validation, so it must be trusted like the rest of
+    the workflow directory: a tampered cache file can crash the process or
+    give wrong query results.
+    """
+    from scipy.spatial import cKDTree
+
+    key = _file_key(filename)
+    if cache_filename is not None and path.exists(cache_filename):
+        try:
+            tree = _load_spatial_index(cache_filename, key, points)
+        except Exception:
+            tree = None
+        if tree is not None:
+            return tree
+
+    tree = cKDTree(points)
+    if cache_filename is not None:
+        try:
+            _save_spatial_index(cache_filename, key, tree)
+        except OSError:
+            pass
+
+    return tree
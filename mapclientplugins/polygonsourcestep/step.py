@@ -47,15 +47,25 @@ class PolygonSourceStep(WorkflowStepMountPoint):
         self.addPort(('http://physiomeproject.org/workflow/1.0/rdf-schema#port',
                       'http://physiomeproject.org/workflow/1.0/rdf-schema#provides',
                       'http://physiomeproject.org/workflow/1.0/rdf-schema#faces'))
+        self.addPort(('http://physiomeproject.org/workflow/1.0/rdf-schema#port',
+                      'http://physiomeproject.org/workflow/1.0/rdf-schema#provides',
+                      'http://physiomeproject.org/workflow/1.0/rdf-schema#polygondata'))
+        self.addPort(('http://physiomeproject.org/workflow/1.0/rdf-schema#port',
+                      'http://physiomeproject.org/workflow/1.0/rdf-schema#provides',
+                      'http://physiomeproject.org/workflow/1.0/rdf-schema#kdtree'))
         self._config = {
             'identifier': '',
             'fileFormat': 'stl',
-            'fileLoc': ''
+            'fileLoc': '',
+            'arrayNames': '',
+            'spatialIndex': False
         }
         # self._config['formatOptions'] = None
 
         self._vertices = None
         self._faces = None
+        self._data = None
+        self._spatialIndex = None
         self._fileLoc = None
 
     def execute(self):
@@ -65,10 +75,22 @@ class PolygonSourceStep(WorkflowStepMountPoint):
         may be connected up to a button in a widget for example.
         """
         # Put your execute step code here before calling the '_doneExecution' method.
-        self._vertices, self._faces = importer.import_polygon(
+        filename = os.path.join(self._location, self._config['fileLoc'])
+        arrayNames = [n.strip() for n in self._config['arrayNames'].split(',') if n.strip()]
+        self._vertices, self._faces, self._data = importer.import_polygon_data(
             self._config['fileFormat'],
-            os.path.join(self._location, self._config['fileLoc'])
+            filename,
+            arrayNames or None
         )
+        if self._config['spatialIndex']:
+            self._spatialIndex = importer.spatial_index(
+                self._vertices,
+                filename,
+                self._spatialIndexCacheFile(self._config['identifier'])
+            )
+        else:
+            self._spatialIndex = None
+            self._removeSpatialIndexCache(self._config['identifier'])
         self._doneExecution()
 
     def setPortData(self, index, dataIn):
@@ -83,8 +105,12 @@ class PolygonSourceStep(WorkflowStepMountPoint):
     def getPortData(self, index):
         if index == 1:
             return self._vertices
-        else:
+        elif index == 2:
             return self._faces
+        elif index == 3:
+            return self._data
+        else:
+            return self._spatialIndex
 
     def configure(self):
         """
@@ -102,11 +128,28 @@ class PolygonSourceStep(WorkflowStepMountPoint):
         dlg.setModal(True)
 
         if dlg.exec_():
+            identifier = self._config['identifier']
             self._config = dlg.getConfig()
+            if identifier != self._config['identifier']:
+                self._removeSpatialIndexCache(identifier)
 
         self._configured = dlg.validate()
         self._configuredObserver()
 
+    def _spatialIndexCacheFile(self, identifier):
+        return os.path.join(self._location, identifier + '.kdtree')
+
+    def _removeSpatialIndexCache(self, identifier):
+        """
+        Remove a spatial index cache left by an earlier configuration.
+        """
+        cacheFile = self._spatialIndexCacheFile(identifier)
+        if identifier and os.path.exists(cacheFile):
+            try:
+                os.remove(cacheFile)
+            except OSError:
+                pass
+
     def getIdentifier(self):
         """
         The identifier is a string that must be unique within a workflow.
@@ -15,7 +15,7 @@ from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
     QFont, QFontDatabase, QGradient, QIcon,
     QImage, QKeySequence, QLinearGradient, QPainter,
     QPalette, QPixmap, QRadialGradient, QTransform)
-from PySide6.QtWidgets import (QAbstractButton, QApplication, QComboBox, QDialog,
+from PySide6.QtWidgets import (QAbstractButton, QApplication, QCheckBox, QComboBox, QDialog,
     QDialogButtonBox, QFormLayout, QGridLayout, QGroupBox,
     QHBoxLayout, QLabel, QLineEdit, QPushButton,
     QSizePolicy, QWidget)
@@ -72,6 +72,26 @@ class Ui_Dialog(object):
 
         self.formLayout.setLayout(2, QFormLayout.FieldRole, self.horizontalLayout)
 
+        self.arrayNamesLabel = QLabel(self.configGroupBox)
+        self.arrayNamesLabel.setObjectName(u"arrayNamesLabel")
+
+        self.formLayout.setWidget(3, QFormLayout.LabelRole, self.arrayNamesLabel)
+
+        self.arrayNamesLineEdit = QLineEdit(self.configGroupBox)
+        self.arrayNamesLineEdit.setObjectName(u"arrayNamesLineEdit")
+
+        self.formLayout.setWidget(3, QFormLayout.FieldRole, self.arrayNamesLineEdit)
+
+        self.spatialIndexLabel = QLabel(self.configGroupBox)
+        self.spatialIndexLabel.setObjectName(u"spatialIndexLabel")
+
+        self.formLayout.setWidget(4, QFormLayout.LabelRole, self.spatialIndexLabel)
+
+        self.spatialIndexCheckBox = QCheckBox(self.configGroupBox)
+        self.spatialIndexCheckBox.setObjectName(u"spatialIndexCheckBox")
+
+        self.formLayout.setWidget(4, QFormLayout.FieldRole, self.spatialIndexCheckBox)
+
 
         self.gridLayout.addWidget(self.configGroupBox, 0, 0, 1, 1)
 
@@ -85,7 +105,9 @@ class Ui_Dialog(object):
         QWidget.setTabOrder(self.idLineEdit, self.fileFormatCombo)
         QWidget.setTabOrder(self.fileFormatCombo, self.fileLocLineEdit)
         QWidget.setTabOrder(self.fileLocLineEdit, self.fileLocButton)
-        QWidget.setTabOrder(self.fileLocButton, self.buttonBox)
+        QWidget.setTabOrder(self.fileLocButton, self.arrayNamesLineEdit)
+        QWidget.setTabOrder(self.arrayNamesLineEdit, self.spatialIndexCheckBox)
+        QWidget.setTabOrder(self.spatialIndexCheckBox, self.buttonBox)
 
         self.retranslateUi(Dialog)
         self.buttonBox.accepted.connect(Dialog.accept)
@@ -101,5 +123,11 @@ class Ui_Dialog(object):
         self.fileFormatLabel.setText(QCoreApplication.translate("Dialog", u"File Format:", None))
         self.fileLocLabel.setText(QCoreApplication.translate("Dialog", u"Filename:", None))
         self.fileLocButton.setText(QCoreApplication.translate("Dialog", u"...", None))
+        self.arrayNamesLabel.setText(QCoreApplication.translate("Dialog", u"Data Arrays:", None))
+#if QT_CONFIG(tooltip)
+        self.arrayNamesLineEdit.setToolTip(QCoreApplication.translate("Dialog", u"Comma-separated names of the point and cell data arrays to output. Leave empty to output all arrays.", None))
+#endif // QT_CONFIG(tooltip)
+        self.spatialIndexLabel.setText(QCoreApplication.translate("Dialog", u"Spatial Index:", None))
+        self.spatialIndexCheckBox.setText(QCoreApplication.translate("Dialog", u"Build KD-tree", None))
     # retranslateUi
 
@@ -0,0 +1,135 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+from vtkmodules.vtkCommonCore import vtkIntArray
+from vtkmodules.vtkCommonDataModel import vtkCellArray
+from vtkmodules.vtkFiltersSources import vtkSphereSource
+from vtkmodules.vtkIOXML import vtkXMLPolyDataWriter
+
+from mapclientplugins.polygonsourcestep import importer
+
+
+def _write_mesh(filename):
+    """Write a sphere with two vertex cells ahead of its polygons, a
+    point-data array 'label' and a cell-data array 'faceid'.
+    """
+    s = vtkSphereSource()
+    s.Update()
+    polydata = s.GetOutput()
+
+    verts = vtkCellArray()
+    for i in range(2):
+        verts.InsertNextCell(1)
+        verts.InsertCellPoint(i)
+    polydata.SetVerts(verts)
+
+    label = vtkIntArray()
+    label.SetName('label')
+    for i in range(polydata.GetNumberOfPoints()):
+        label.InsertNextValue(i)
+    polydata.GetPointData().AddArray(label)
+
+    # cell data follows vtk's cell order: the two verts, then the polys
+    faceid = vtkIntArray()
+    faceid.SetName('faceid')
+    for i in [-1, -1] + list(range(polydata.GetNumberOfPolys())):
+        faceid.InsertNextValue(i)
+    polydata.GetCellData().AddArray(faceid)
+
+    w = vtkXMLPolyDataWriter()
+    w.SetFileName(filename)
+    w.SetInputData(polydata)
+    w.Write()
+
+
+class ImportPolygonDataTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self._dir = tempfile.mkdtemp()
+        self._filename = os.path.join(self._dir, 'sphere.vtp')
+        _write_mesh(self._filename)
+
+    def tearDown(self):
+        shutil.rmtree(self._dir)
+
+    def test_all_arrays(self):
+        points, faces, data = importer.import_polygon_data('vtp', self._filename)
+
+        self.assertEqual(points.shape[1], 3)
+        self.assertIn('label', data['point'])
+        np.testing.assert_array_equal(data['point']['label'], np.arange(len(points)))
+        # cell data is aligned with faces, skipping the vertex cells
+        np.testing.assert_array_equal(data['cell']['faceid'], np.arange(len(faces)))
+
+    def test_selected_arrays(self):
+        _, _, data = importer.import_polygon_data('vtp', self._filename, ['faceid'])
+
+        self.assertEqual(data['point'], {})
+        self.assertEqual(list(data['cell']), ['faceid'])
+
+    def test_missing_array(self):
+        with self.assertRaises(ValueError):
+            importer.import_polygon_data('vtp', self._filename, ['label', 'missing'])
+
+
+class SpatialIndexTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self._dir = tempfile.mkdtemp()
+        self._filename = os.path.join(self._dir, 'sphere.vtp')
+        self._cacheFilename = os.path.join(self._dir, 'sphere.kdtree')
+        _write_mesh(self._filename)
+        self._points = importer.import_polygon('vtp', self._filename)[0]
+
+    def tearDown(self):
+        shutil.rmtree(self._dir)
+
+    def _assertSameNeighbours(self, tree, expected):
+        queries = self._points + 1e-3
+        np.testing.assert_array_equal(tree.query(queries)[1], expected.query(queries)[1])
+
+    def test_round_trip(self):
+        tree = importer.spatial_index(self._points, self._filename, self._cacheFilename)
+        self.assertTrue(os.path.exists(self._cacheFilename))
+        mtime = os.path.getmtime(self._cacheFilename)
+
+        cached = importer.spatial_index(self._points, self._filename, self._cacheFilename)
+
+        self.assertIsNot(cached, tree)
+        # a cache hit does not rewrite the file
+        self.assertEqual(os.path.getmtime(self._cacheFilename), mtime)
+        self._assertSameNeighbours(cached, tree)
+
+    def test_corrupt_cache(self):
+        tree = importer.spatial_index(self._points, self._filename, self._cacheFilename)
+        with open(self._cacheFilename, 'r+b') as f:
+            f.truncate(os.path.getsize(self._cacheFilename) // 2)
+
+        rebuilt = importer.spatial_index(self._points, self._filename, self._cacheFilename)
+
+        self._assertSameNeighbours(rebuilt, tree)
+        # the corrupt file is replaced by a valid cache
+        cached = importer.spatial_index(self._points, self._filename, self._cacheFilename)
+        self._assertSameNeighbours(cached, tree)
+
+    def test_cache_of_other_points(self):
+        importer.spatial_index(self._points[:-1], self._filename, self._cacheFilename)
+
+        tree = importer.spatial_index(self._points, self._filename, self._cacheFilename)
+
+        self.assertEqual(tree.n, len(self._points))
+
+    def test_unwritable_cache(self):
+        cacheFilename = os.path.join(self._dir, 'missing', 'sphere.kdtree')
+
+        tree = importer.spatial_index(self._points, self._filename, cacheFilename)
+
+        self.assertEqual(tree.n, len(self._points))
+        self.assertFalse(os.path.exists(cacheFilename))
+
+
+if __name__ == '__main__':
+    unittest.main()